@@ -29,17 +29,39 @@ Example:
 """
 
 import ast
+import bisect
 import json
 import logging
+import mmap
+import os
 import re
+import sys
+from array import array
+from collections.abc import Iterator, Set as AbstractSet
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby, repeat
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
+
+# Optional fast JSON parser - large coverage.json files parse ~5x faster
+# with orjson, but it stays an optional extra (zero required runtime deps)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming JSON parser for reports too large to decode in one shot
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class UncoveredBlock:
     """A block of uncovered code with context."""
 
@@ -53,7 +75,7 @@ class UncoveredBlock:
     condition: Optional[str] = None  # The condition that wasn't tested
 
 
-@dataclass
+@dataclass(slots=True)
 class GapSuggestion:
     """A specific test you should write to cover a gap."""
 
@@ -79,14 +101,16 @@ class GapSuggestion:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FileCoverage:
     """Coverage data for a single file."""
 
+    # Parsing builds frozensets; the annotations stay at AbstractSet so
+    # callers constructing FileCoverage by hand can pass plain sets
     path: str
-    covered_lines: set[int]
-    missing_lines: set[int]
-    excluded_lines: set[int]
+    covered_lines: AbstractSet[int]
+    missing_lines: AbstractSet[int]
+    excluded_lines: AbstractSet[int]
     missing_branches: list[tuple[int, int]]  # (from_line, to_line)
 
     @property
@@ -97,7 +121,7 @@ class FileCoverage:
         return len(self.covered_lines) / total * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageReport:
     """Parsed coverage.py report."""
 
@@ -113,15 +137,27 @@ class CoverageReport:
         return self.total_covered / total * 100
 
 
+# Reports above this size stream through ijson (when installed) instead
+# of being decoded in one shot
+_STREAM_SIZE_THRESHOLD = 50 * 1024 * 1024
+
+# Shared default for absent coverage keys - avoids allocating a fresh
+# empty list per dict.get call in the per-file parsing loop
+_EMPTY: tuple = ()
+
+
 class CoverageParser:
     """Parse coverage.py JSON output."""
 
-    def parse(self, json_path: str) -> CoverageReport:
+    def parse(
+        self, json_path: "str | os.PathLike[str] | IO[str] | IO[bytes]"
+    ) -> CoverageReport:
         """
         Parse coverage.json file.
 
         Args:
-            json_path: Path to coverage.json
+            json_path: Path to coverage.json, or an already-open
+                file-like object to read the report from
 
         Returns:
             CoverageReport with file-level coverage data
@@ -130,39 +166,109 @@ class CoverageParser:
             FileNotFoundError: If json_path doesn't exist
             json.JSONDecodeError: If file is not valid JSON
         """
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # File-like objects (e.g. io.StringIO, a stream handed over by a
+        # host) skip the filesystem entirely. The isinstance check (rather
+        # than probing for .read) narrows the union, so the path branches
+        # below type-check against path types only.
+        if not isinstance(json_path, (str, os.PathLike)):
+            raw = json_path.read()
+            if isinstance(raw, str):
+                raw = raw.encode("utf-8")
+            return self.parse_bytes(raw)
+
+        # Very large reports stream one file entry at a time so peak
+        # memory stays flat instead of ~3x the file size
+        if ijson is not None and os.path.getsize(json_path) > _STREAM_SIZE_THRESHOLD:
+            files = {}
+            total_covered = 0
+            total_missing = 0
+            for file_cov in self.parse_streaming(json_path):
+                files[file_cov.path] = file_cov
+                total_covered += len(file_cov.covered_lines)
+                total_missing += len(file_cov.missing_lines)
+            return CoverageReport(
+                files=files,
+                total_covered=total_covered,
+                total_missing=total_missing,
+            )
+
+        with open(json_path, "rb") as f:
+            if orjson is not None:
+                # Map the file and decode straight out of the page cache
+                # instead of copying it into an intermediate bytes object
+                # first. Empty files can't be mapped; fall through to the
+                # plain read. orjson rejects mmap objects, so hand it a
+                # memoryview over the map.
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    pass
+                else:
+                    with mm:
+                        view = memoryview(mm)
+                        try:
+                            return self.parse_bytes(view)
+                        finally:
+                            # A propagating decode error still references
+                            # the view from its traceback; release it so
+                            # closing the map can't raise BufferError
+                            view.release()
+            return self.parse_bytes(f.read())
+
+    def parse_bytes(self, raw: "bytes | bytearray | memoryview") -> CoverageReport:
+        """
+        Parse coverage.json content already held in memory.
+
+        Callers that obtain the report as bytes (e.g. from an artifact
+        store) can skip the disk round-trip that parse() implies.
+
+        Args:
+            raw: coverage.json content
+
+        Returns:
+            CoverageReport with file-level coverage data
+
+        Raises:
+            json.JSONDecodeError: If raw is not valid JSON
+        """
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError as e:
+                # Preserve the documented json.JSONDecodeError contract
+                raise json.JSONDecodeError(
+                    str(e), bytes(raw).decode("utf-8", errors="replace"), 0
+                ) from e
+        else:
+            # json.loads takes str/bytes/bytearray but not buffer objects
+            if isinstance(raw, memoryview):
+                raw = bytes(raw)
+            data = json.loads(raw)
 
+        return self.parse_dict(data)
+
+    def parse_dict(self, data: dict) -> CoverageReport:
+        """
+        Build a CoverageReport from already-decoded coverage.json data.
+
+        Useful when the report is produced or held in memory (e.g. by an
+        MCP host or a test) and there is nothing to decode.
+
+        Args:
+            data: Parsed coverage.json content
+
+        Returns:
+            CoverageReport with file-level coverage data
+        """
         files = {}
         total_covered = 0
         total_missing = 0
 
         for file_path, file_data in data.get("files", {}).items():
-            # Get line data
-            executed = set(file_data.get("executed_lines", []))
-            missing = set(file_data.get("missing_lines", []))
-            excluded = set(file_data.get("excluded_lines", []))
-
-            # Get branch data if available
-            missing_branches = []
-            for branch_key, branch_data in file_data.get("missing_branches", {}).items():
-                try:
-                    from_line = int(branch_key)
-                    for to_line in branch_data:
-                        missing_branches.append((from_line, to_line))
-                except (ValueError, TypeError):
-                    pass
-
-            files[file_path] = FileCoverage(
-                path=file_path,
-                covered_lines=executed,
-                missing_lines=missing,
-                excluded_lines=excluded,
-                missing_branches=missing_branches,
-            )
-
-            total_covered += len(executed)
-            total_missing += len(missing)
+            file_cov = self._parse_file(file_path, file_data)
+            files[file_path] = file_cov
+            total_covered += len(file_cov.covered_lines)
+            total_missing += len(file_cov.missing_lines)
 
         return CoverageReport(
             files=files,
@@ -170,14 +276,89 @@ class CoverageParser:
             total_missing=total_missing,
         )
 
+    def parse_streaming(self, json_path: "str | os.PathLike[str]") -> Iterator[FileCoverage]:
+        """
+        Stream FileCoverage entries from coverage.json one at a time.
+
+        Decodes the "files" object incrementally so arbitrarily large
+        reports parse in constant memory. Requires the optional ijson
+        package.
+
+        Args:
+            json_path: Path to coverage.json
+
+        Yields:
+            FileCoverage for each file entry, in report order
+
+        Raises:
+            RuntimeError: If ijson is not installed
+            FileNotFoundError: If json_path doesn't exist
+        """
+        if ijson is None:
+            raise RuntimeError("parse_streaming requires the optional ijson package")
+
+        with open(json_path, "rb") as f:
+            for file_path, file_data in ijson.kvitems(f, "files"):
+                yield self._parse_file(file_path, file_data)
+
+    @staticmethod
+    def _parse_file(file_path: str, file_data: dict) -> FileCoverage:
+        """Build a FileCoverage from one coverage.json file entry."""
+        # Get line data. The sets are never mutated after construction,
+        # so frozenset buys the single bulk resize and skips the mutation
+        # guards on membership tests.
+        executed = frozenset(file_data.get("executed_lines") or _EMPTY)
+        missing = frozenset(file_data.get("missing_lines") or _EMPTY)
+        excluded = frozenset(file_data.get("excluded_lines") or _EMPTY)
+
+        # Get branch data if available. Keys are digit strings in
+        # coverage.py JSON (negative for exit branches), so a cheap
+        # isdigit check replaces try/except in this hot loop.
+        branches = file_data.get("missing_branches")
+        missing_branches = [
+            (int(branch_key), to_line)
+            for branch_key, branch_data in branches.items()
+            if branch_key.lstrip("-").isdigit()
+            for to_line in branch_data
+        ] if branches else []
+
+        return FileCoverage(
+            path=file_path,
+            covered_lines=executed,
+            missing_lines=missing,
+            excluded_lines=excluded,
+            missing_branches=missing_branches,
+        )
+
+
+# ast.parse dominates analyze() for typical files, and the same source
+# text comes back repeatedly (re-runs over unchanged files, several
+# analyses of one file). Module-level so every GapAnalyzer instance in
+# the process shares it; the visitor never mutates the tree, so sharing
+# is safe. SyntaxError is not cached - lru_cache only stores successful
+# results - which keeps the line-based fallback path intact.
+@lru_cache(maxsize=256)
+def _parse_cached(source_code: str) -> ast.AST:
+    return ast.parse(source_code)
+
 
 class GapAnalyzer(ast.NodeVisitor):
     """Analyze AST to understand what uncovered code does."""
 
-    def __init__(self, source_code: str, missing_lines: set[int]):
+    def __init__(self, source_code: str, missing_lines: AbstractSet[int]):
         self.source_code = source_code
-        self.source_lines = source_code.splitlines()
+        # Line start offsets instead of splitlines(): snippets slice the
+        # original string on demand, so we never materialize a list of
+        # every line just to extract a handful of blocks
+        self._line_starts = [0]
+        pos = source_code.find("\n")
+        while pos != -1:
+            self._line_starts.append(pos + 1)
+            pos = source_code.find("\n", pos + 1)
         self.missing_lines = missing_lines
+        # Sorted copy as a C int array: 4 bytes per line number instead of
+        # a PyLong per element, and contiguous for the bisect probes
+        self._sorted_missing = array("i", sorted(missing_lines))
         self.uncovered_blocks: list[UncoveredBlock] = []
 
         # Context tracking
@@ -185,37 +366,75 @@ class GapAnalyzer(ast.NodeVisitor):
         self._current_function: Optional[str] = None
         self._current_file: str = ""
         self._seen_blocks: set[tuple[int, int]] = set()  # Avoid duplicates
+        self._unparse_cache: dict[int, str] = {}  # id(node) -> unparsed source
+
+        # Dispatch by exact node type - a dict lookup beats an isinstance
+        # chain for the common case where a node matches no handler
+        self._handlers = {
+            ast.If: self._analyze_if,
+            ast.ExceptHandler: self._analyze_except,
+            ast.Return: self._analyze_return,
+            ast.Raise: self._analyze_raise,
+            ast.For: self._analyze_loop,
+            ast.While: self._analyze_loop,
+        }
+
+    def analyze(
+        self, file_path: str, tree: Optional[ast.AST] = None
+    ) -> list[UncoveredBlock]:
+        """Analyze a file and return uncovered blocks with context.
 
-    def analyze(self, file_path: str) -> list[UncoveredBlock]:
-        """Analyze a file and return uncovered blocks with context."""
+        Callers that already hold a parsed tree for this source (e.g. to
+        run several analyses over the same file) can pass it in to skip
+        the ast.parse.
+        """
         self._current_file = file_path
 
+        # Nothing missing means nothing to find - don't even parse
+        if not self.missing_lines:
+            return self.uncovered_blocks
+
+        if tree is not None:
+            self.visit(tree)
+            return self.uncovered_blocks
+
+        # ast.parse is the most expensive step per file. A file without a
+        # single def or class can only yield line-based blocks anyway, so
+        # go straight to the line grouping fallback. The substring probe
+        # is only a cheap pre-filter; the AST branch below reaches the
+        # same fallback for def-less files where the probe false-positives
+        # (e.g. 'def ' inside a comment), so output never depends on
+        # comment text.
+        if "def " not in self.source_code and "class " not in self.source_code:
+            self._analyze_by_lines()
+            return self.uncovered_blocks
+
         try:
-            tree = ast.parse(self.source_code)
+            tree = _parse_cached(self.source_code)
             self.visit(tree)
         except SyntaxError as e:
             logger.debug(f"Syntax error in {file_path}: {e}, falling back to line-based analysis")
             self._analyze_by_lines()
+        else:
+            if not self.uncovered_blocks and not any(
+                isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+                for n in ast.walk(tree)
+            ):
+                self._analyze_by_lines()
 
         return self.uncovered_blocks
 
     def _analyze_by_lines(self) -> None:
         """Fallback: analyze uncovered lines without AST."""
-        sorted_missing = sorted(self.missing_lines)
+        sorted_missing = self._sorted_missing
         if not sorted_missing:
             return
 
-        # Group consecutive lines
-        groups: list[list[int]] = []
-        current_group = [sorted_missing[0]]
-
-        for line in sorted_missing[1:]:
-            if line == current_group[-1] + 1:
-                current_group.append(line)
-            else:
-                groups.append(current_group)
-                current_group = [line]
-        groups.append(current_group)
+        # Group consecutive lines: runs share the same line - index delta
+        groups = [
+            [line for _, line in run]
+            for _, run in groupby(enumerate(sorted_missing), key=lambda iv: iv[1] - iv[0])
+        ]
 
         for group in groups:
             snippet = self._get_code_snippet(group[0], group[-1])
@@ -229,11 +448,21 @@ class GapAnalyzer(ast.NodeVisitor):
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Track class context."""
+        # Prune fully-covered classes: no missing line in the class span
+        # means nothing below can produce a block, so skip the subtree
+        if not self._span_has_missing(node.lineno, node.end_lineno or node.lineno):
+            return
+
         old_class = self._current_class
         self._current_class = node.name
         self.generic_visit(node)
         self._current_class = old_class
 
+    def _span_has_missing(self, start: int, end: int) -> bool:
+        """Whether any missing line falls within [start, end]."""
+        lo = bisect.bisect_left(self._sorted_missing, start)
+        return lo < len(self._sorted_missing) and self._sorted_missing[lo] <= end
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Analyze function for uncovered code."""
         self._analyze_function(node)
@@ -249,21 +478,45 @@ class GapAnalyzer(ast.NodeVisitor):
         old_function = self._current_function
         self._current_function = node.name
 
-        # Check if function body has uncovered lines
-        end_line = node.end_lineno or node.lineno
-        func_lines = set(range(node.lineno, end_line + 1))
-        uncovered_in_func = func_lines & self.missing_lines
+        # Check if function body has uncovered lines. An interval test on
+        # the sorted missing list is O(log n) and avoids materializing a
+        # set of every line in the function for fully-covered functions.
+        if self._span_has_missing(node.lineno, node.end_lineno or node.lineno):
+            # Visit function body; the visit_* hooks below dispatch
+            # _analyze_node so each AST node is touched exactly once
+            self.generic_visit(node)
 
-        if uncovered_in_func:
-            # Walk function body to find specific uncovered constructs
-            for child in ast.walk(node):
-                self._analyze_node(child)
+        self._current_function = old_function
 
+    def visit_If(self, node: ast.If) -> None:
+        self._analyze_node(node)
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        self._analyze_node(node)
+        self.generic_visit(node)
+
+    def visit_Return(self, node: ast.Return) -> None:
+        self._analyze_node(node)
+        self.generic_visit(node)
+
+    def visit_Raise(self, node: ast.Raise) -> None:
+        self._analyze_node(node)
+        self.generic_visit(node)
+
+    def visit_For(self, node: ast.For) -> None:
+        self._analyze_node(node)
+        self.generic_visit(node)
+
+    def visit_While(self, node: ast.While) -> None:
+        self._analyze_node(node)
         self.generic_visit(node)
-        self._current_function = old_function
 
     def _analyze_node(self, node: ast.AST) -> None:
         """Analyze a specific node for uncovered code."""
+        if self._current_function is None:
+            return  # Only report blocks inside functions (same as before)
+
         if not hasattr(node, "lineno"):
             return
 
@@ -278,16 +531,9 @@ class GapAnalyzer(ast.NodeVisitor):
             return
         self._seen_blocks.add(block_key)
 
-        if isinstance(node, ast.If):
-            self._analyze_if(node)
-        elif isinstance(node, ast.ExceptHandler):
-            self._analyze_except(node)
-        elif isinstance(node, ast.Return):
-            self._analyze_return(node)
-        elif isinstance(node, ast.Raise):
-            self._analyze_raise(node)
-        elif isinstance(node, (ast.For, ast.While)):
-            self._analyze_loop(node)
+        handler = self._handlers.get(type(node))
+        if handler:
+            handler(node)
 
     def _analyze_if(self, node: ast.If) -> None:
         """Analyze uncovered if branch."""
@@ -397,38 +643,101 @@ class GapAnalyzer(ast.NodeVisitor):
             function_name=self._current_function,
             class_name=self._current_class,
             code_snippet=self._get_code_snippet(node.lineno, end_line),
-            block_type=f"{loop_type}_loop",
+            # Interned so thousands of loop blocks share one string object
+            block_type=sys.intern(f"{loop_type}_loop"),
         ))
 
     def _get_source_segment(self, node: ast.AST) -> str:
         """Get source code for an AST node."""
+        # Slice the user's actual source rather than re-rendering the
+        # subtree with ast.unparse (which canonicalizes, e.g. adds
+        # parentheses). The same condition is requested for both arms of
+        # an if, so memoize per analyze() call, keyed by id(node) - safe
+        # while the tree is alive, which it is here.
+        key = id(node)
+        cached = self._unparse_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            return ast.unparse(node)
+            result = ast.get_source_segment(self.source_code, node) or "..."
         except Exception:
-            return "..."
+            result = "..."
+
+        self._unparse_cache[key] = result
+        return result
 
     def _get_code_snippet(self, start: int, end: int) -> str:
         """Get code snippet for line range (1-indexed)."""
-        try:
-            lines = self.source_lines[start - 1:end]
-            return "\n".join(lines)
-        except IndexError:
+        if start < 1 or start > len(self._line_starts):
             return ""
+        begin = self._line_starts[start - 1]
+        if end < len(self._line_starts):
+            stop = self._line_starts[end]
+        else:
+            stop = len(self.source_code)
+        return self.source_code[begin:stop].rstrip("\n")
+
+
+_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+_PRIORITY_MARKERS = {"critical": "[!!]", "high": "[! ]", "medium": "[  ]", "low": "[  ]"}
+
+
+def _suggestion_sort_key(s: GapSuggestion) -> tuple[int, str, int]:
+    """Sort by priority, then file, then line for deterministic output."""
+    return (
+        _PRIORITY_ORDER.get(s.priority, 4),
+        s.test_file,
+        s.covers_lines[0] if s.covers_lines else 0,
+    )
 
 
 class GapSuggestionGenerator:
     """Generate test suggestions from uncovered blocks."""
 
-    # Regex compiled once at class level for performance
-    _CAMEL_RE1 = re.compile(r"(.)([A-Z][a-z]+)")
-    _CAMEL_RE2 = re.compile(r"([a-z0-9])([A-Z])")
+    # Regex compiled once at class level for performance. The two lookaround
+    # branches insert an underscore at lower->upper and acronym boundaries
+    # in a single pass; results are memoized since class names repeat.
+    _CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+    _snake_cache: dict[str, str] = {}
+
+    # Hint keywords compiled into a single alternation so each snippet is
+    # scanned once instead of once per keyword. Rules stay in emit order;
+    # each hint appears at most once.
+    _HINT_RULES: list[tuple[tuple[str, ...], str]] = [
+        (("request", "http"), "Mock HTTP requests with responses or httpx"),
+        (("open(", "path"), "Mock file operations with tmp_path fixture"),
+        (("await", "async"), "Use @pytest.mark.asyncio decorator"),
+        (("database", "cursor", "session"), "Mock database connections"),
+        (("datetime", "time."), "Use freezegun or mock datetime.now()"),
+        (("random",), "Seed random or mock random functions"),
+        (("environ", "getenv"), "Use monkeypatch.setenv() for env vars"),
+        (("subprocess", "popen"), "Mock subprocess calls"),
+        (("socket",), "Mock socket connections"),
+    ]
+    # Wrapped in a lookahead so matches can overlap: a plain alternation
+    # consumes its match, and e.g. "popen" would eat the text "open("
+    # needs, dropping the file-ops hint.
+    _HINT_RE = re.compile(
+        "(?=("
+        + "|".join(
+            re.escape(keyword) for keywords, _ in _HINT_RULES for keyword in keywords
+        )
+        + "))",
+        re.IGNORECASE,
+    )
 
     def generate(
         self,
         blocks: list[UncoveredBlock],
         file_path: str,
+        sort: bool = True,
     ) -> list[GapSuggestion]:
-        """Generate test suggestions for uncovered blocks."""
+        """Generate test suggestions for uncovered blocks.
+
+        Pass sort=False when the caller merges suggestions from several
+        files and sorts once at the end.
+        """
         suggestions = []
 
         for block in blocks:
@@ -436,13 +745,8 @@ class GapSuggestionGenerator:
             if suggestion:
                 suggestions.append(suggestion)
 
-        # Sort by priority, then file, then line for deterministic output
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        suggestions.sort(key=lambda s: (
-            priority_order.get(s.priority, 4),
-            s.test_file,
-            s.covers_lines[0] if s.covers_lines else 0,
-        ))
+        if sort:
+            suggestions.sort(key=_suggestion_sort_key)
 
         return suggestions
 
@@ -454,7 +758,7 @@ class GapSuggestionGenerator:
         """Create a test suggestion for an uncovered block."""
         test_name = self._generate_test_name(block)
         priority = self._determine_priority(block)
-        template = self._generate_template(block)
+        template = self._generate_template(test_name, block)
         hints = self._generate_hints(block)
         test_file = self._suggest_test_file(file_path)
 
@@ -494,35 +798,38 @@ class GapSuggestionGenerator:
 
         return "_".join(parts)
 
+    # Block types with a fixed priority; anything else is medium inside
+    # a function, low otherwise
+    _PRIORITY_TABLE = {
+        "exception_handler": "critical",
+        "raise_statement": "critical",
+        "if_true_branch": "high",
+        "if_false_branch": "high",
+    }
+
     def _determine_priority(self, block: UncoveredBlock) -> str:
         """Determine priority based on block type."""
-        critical_types = {"exception_handler", "raise_statement"}
-        high_types = {"if_true_branch", "if_false_branch"}
-
-        if block.block_type in critical_types:
-            return "critical"
-        elif block.block_type in high_types:
-            return "high"
-        elif block.function_name:
-            return "medium"
-        return "low"
-
-    def _generate_template(self, block: UncoveredBlock) -> str:
+        priority = self._PRIORITY_TABLE.get(block.block_type)
+        if priority:
+            return priority
+        return "medium" if block.function_name else "low"
+
+    def _generate_template(self, test_name: str, block: UncoveredBlock) -> str:
         """Generate a test code template."""
         func = block.function_name or "function_under_test"
         cls = block.class_name
 
         if block.block_type == "exception_handler":
-            return self._exception_test_template(func, cls, block)
+            return self._exception_test_template(test_name, func, cls, block)
         elif block.block_type == "raise_statement":
-            return self._raise_test_template(func, cls, block)
+            return self._raise_test_template(test_name, func, cls, block)
         elif block.block_type in ("if_true_branch", "if_false_branch"):
-            return self._branch_test_template(func, cls, block)
+            return self._branch_test_template(test_name, func, cls, block)
         else:
-            return self._generic_test_template(func, cls, block)
+            return self._generic_test_template(test_name, func, cls, block)
 
     def _exception_test_template(
-        self, func: str, cls: Optional[str], block: UncoveredBlock
+        self, test_name: str, func: str, cls: Optional[str], block: UncoveredBlock
     ) -> str:
         """Template for testing exception handlers."""
         exc_type = "Exception"
@@ -530,7 +837,7 @@ class GapSuggestionGenerator:
             exc_type = block.condition.split("when ")[-1].replace(" is raised", "")
 
         if cls:
-            return f'''def {self._generate_test_name(block)}():
+            return f'''def {test_name}():
     """Test that {cls}.{func} handles {exc_type}."""
     instance = {cls}()  # TODO: Add constructor args
 
@@ -543,7 +850,7 @@ class GapSuggestionGenerator:
     # Assert: Verify exception was handled correctly
     # TODO: Add assertions
 '''
-        return f'''def {self._generate_test_name(block)}():
+        return f'''def {test_name}():
     """Test that {func} handles {exc_type}."""
     # Arrange: Set up conditions to trigger {exc_type}
     # TODO: Mock dependencies to raise {exc_type}
@@ -556,7 +863,7 @@ class GapSuggestionGenerator:
 '''
 
     def _raise_test_template(
-        self, func: str, cls: Optional[str], block: UncoveredBlock
+        self, test_name: str, func: str, cls: Optional[str], block: UncoveredBlock
     ) -> str:
         """Template for testing raise statements."""
         exc_type = "Exception"
@@ -564,7 +871,7 @@ class GapSuggestionGenerator:
             exc_type = block.condition.split("raise ")[-1]
 
         if cls:
-            return f'''def {self._generate_test_name(block)}():
+            return f'''def {test_name}():
     """Test that {cls}.{func} raises {exc_type}."""
     import pytest
     instance = {cls}()  # TODO: Add constructor args
@@ -576,7 +883,7 @@ class GapSuggestionGenerator:
     with pytest.raises({exc_type}):
         instance.{func}()  # TODO: Add args that trigger error
 '''
-        return f'''def {self._generate_test_name(block)}():
+        return f'''def {test_name}():
     """Test that {func} raises {exc_type}."""
     import pytest
 
@@ -589,13 +896,13 @@ class GapSuggestionGenerator:
 '''
 
     def _branch_test_template(
-        self, func: str, cls: Optional[str], block: UncoveredBlock
+        self, test_name: str, func: str, cls: Optional[str], block: UncoveredBlock
     ) -> str:
         """Template for testing conditional branches."""
         condition = block.condition or "the condition"
 
         if cls:
-            return f'''def {self._generate_test_name(block)}():
+            return f'''def {test_name}():
     """Test {cls}.{func} {condition}."""
     instance = {cls}()  # TODO: Add constructor args
 
@@ -608,7 +915,7 @@ class GapSuggestionGenerator:
     # Assert
     # TODO: Verify behavior when {condition}
 '''
-        return f'''def {self._generate_test_name(block)}():
+        return f'''def {test_name}():
     """Test {func} {condition}."""
     # Arrange: Set up inputs so that {condition}
     # TODO: Determine inputs that satisfy this condition
@@ -621,11 +928,11 @@ class GapSuggestionGenerator:
 '''
 
     def _generic_test_template(
-        self, func: str, cls: Optional[str], block: UncoveredBlock
+        self, test_name: str, func: str, cls: Optional[str], block: UncoveredBlock
     ) -> str:
         """Generic test template."""
         if cls:
-            return f'''def {self._generate_test_name(block)}():
+            return f'''def {test_name}():
     """Test {cls}.{func} (lines {block.start_line}-{block.end_line})."""
     instance = {cls}()  # TODO: Add constructor args
 
@@ -638,7 +945,7 @@ class GapSuggestionGenerator:
     # Assert
     # TODO: Add assertions
 '''
-        return f'''def {self._generate_test_name(block)}():
+        return f'''def {test_name}():
     """Test {func} (lines {block.start_line}-{block.end_line})."""
     # Arrange
     # TODO: Set up test data
@@ -652,29 +959,16 @@ class GapSuggestionGenerator:
 
     def _generate_hints(self, block: UncoveredBlock) -> list[str]:
         """Generate setup hints based on the uncovered code."""
-        hints = []
-        snippet_lower = block.code_snippet.lower()
-
-        if "request" in snippet_lower or "http" in snippet_lower:
-            hints.append("Mock HTTP requests with responses or httpx")
-        if "open(" in snippet_lower or "path" in snippet_lower:
-            hints.append("Mock file operations with tmp_path fixture")
-        if "await" in snippet_lower or "async" in snippet_lower:
-            hints.append("Use @pytest.mark.asyncio decorator")
-        if "database" in snippet_lower or "cursor" in snippet_lower or "session" in snippet_lower:
-            hints.append("Mock database connections")
-        if "datetime" in snippet_lower or "time." in snippet_lower:
-            hints.append("Use freezegun or mock datetime.now()")
-        if "random" in snippet_lower:
-            hints.append("Seed random or mock random functions")
-        if "environ" in snippet_lower or "getenv" in snippet_lower:
-            hints.append("Use monkeypatch.setenv() for env vars")
-        if "subprocess" in snippet_lower or "popen" in snippet_lower:
-            hints.append("Mock subprocess calls")
-        if "socket" in snippet_lower:
-            hints.append("Mock socket connections")
-
-        return hints
+        # Case-insensitive regex avoids copying the whole snippet via .lower()
+        found = {m.group(1).lower() for m in self._HINT_RE.finditer(block.code_snippet)}
+        if not found:
+            return []
+
+        return [
+            hint
+            for keywords, hint in self._HINT_RULES
+            if any(keyword in found for keyword in keywords)
+        ]
 
     def _generate_description(self, block: UncoveredBlock) -> str:
         """Generate a human-readable description."""
@@ -711,13 +1005,84 @@ class GapSuggestionGenerator:
 
     def _to_snake_case(self, name: str) -> str:
         """Convert CamelCase to snake_case."""
-        s1 = self._CAMEL_RE1.sub(r"\1_\2", name)
-        return self._CAMEL_RE2.sub(r"\1_\2", s1).lower()
+        cached = self._snake_cache.get(name)
+        if cached is not None:
+            return cached
+
+        result = self._CAMEL_RE.sub("_", name).lower()
+        self._snake_cache[name] = result
+        return result
+
+
+# Per-file analysis is CPU-bound (AST parse dominates), so large reports
+# fan out to worker processes. Small reports stay serial - pool startup
+# would cost more than it saves.
+_PARALLEL_MIN_FILES = 8
+
+
+def _read_source(path: str) -> str:
+    """Read one source file's text.
+
+    Split out as a seam: tests that only exercise gap detection can
+    substitute an in-memory source here instead of writing files.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def _analyze_one_file(
+    file_path: str,
+    missing_lines: AbstractSet[int],
+    source_root: "Optional[str | os.PathLike[str]]",
+    source_code: Optional[str] = None,
+) -> tuple[list[GapSuggestion], list[str]]:
+    """Analyze one source file: read it, find blocks, generate suggestions.
+
+    Callers that already hold the file's text (e.g. after hashing it for
+    a cache probe) can pass source_code so the file isn't read twice.
+    """
+    # Resolve actual path
+    actual_path = file_path
+    if source_root:
+        actual_path = str(Path(source_root) / file_path)
+
+    if source_code is not None:
+        return _analyze_source(file_path, missing_lines, source_code)
+
+    # Try to read source file
+    try:
+        source_code = _read_source(actual_path)
+    except FileNotFoundError:
+        logger.warning(f"Source file not found: {actual_path}")
+        return [], [f"Source file not found: {actual_path}"]
+    except PermissionError:
+        logger.warning(f"Permission denied reading: {actual_path}")
+        return [], [f"Permission denied reading: {actual_path}"]
+    except Exception as e:
+        logger.warning(f"Error reading {actual_path}: {e}")
+        return [], [f"Error reading {actual_path}: {e}"]
+
+    return _analyze_source(file_path, missing_lines, source_code)
+
+
+def _analyze_source(
+    file_path: str,
+    missing_lines: AbstractSet[int],
+    source_code: str,
+) -> tuple[list[GapSuggestion], list[str]]:
+    """Analyze already-read source text: find blocks, generate suggestions."""
+    analyzer = GapAnalyzer(source_code, missing_lines)
+    blocks = analyzer.analyze(file_path)
+
+    generator = GapSuggestionGenerator()
+    # Sorting happens once across all files in find_coverage_gaps
+    suggestions = generator.generate(blocks, file_path, sort=False)
+    return suggestions, []
 
 
 def find_coverage_gaps(
-    coverage_json: str,
-    source_root: Optional[str] = None,
+    coverage_json: "str | os.PathLike[str]",
+    source_root: "Optional[str | os.PathLike[str]]" = None,
 ) -> tuple[list[GapSuggestion], list[str]]:
     """
     Main entry point: Find what tests are missing based on coverage.
@@ -738,42 +1103,34 @@ def find_coverage_gaps(
     parser = CoverageParser()
     report = parser.parse(coverage_json)
 
+    targets = [
+        (file_path, file_cov.missing_lines)
+        for file_path, file_cov in report.files.items()
+        if file_cov.missing_lines
+    ]
+
+    if len(targets) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(
+                _analyze_one_file,
+                (path for path, _ in targets),
+                (missing for _, missing in targets),
+                repeat(source_root),
+            ))
+    else:
+        results = [
+            _analyze_one_file(path, missing, source_root)
+            for path, missing in targets
+        ]
+
     all_suggestions: list[GapSuggestion] = []
     warnings: list[str] = []
-
-    for file_path, file_cov in report.files.items():
-        if not file_cov.missing_lines:
-            continue
-
-        # Resolve actual path
-        actual_path = file_path
-        if source_root:
-            actual_path = str(Path(source_root) / file_path)
-
-        # Try to read source file
-        try:
-            with open(actual_path, "r", encoding="utf-8", errors="replace") as f:
-                source_code = f.read()
-        except FileNotFoundError:
-            warnings.append(f"Source file not found: {actual_path}")
-            logger.warning(f"Source file not found: {actual_path}")
-            continue
-        except PermissionError:
-            warnings.append(f"Permission denied reading: {actual_path}")
-            logger.warning(f"Permission denied reading: {actual_path}")
-            continue
-        except Exception as e:
-            warnings.append(f"Error reading {actual_path}: {e}")
-            logger.warning(f"Error reading {actual_path}: {e}")
-            continue
-
-        # Analyze and generate suggestions
-        analyzer = GapAnalyzer(source_code, file_cov.missing_lines)
-        blocks = analyzer.analyze(file_path)
-
-        generator = GapSuggestionGenerator()
-        suggestions = generator.generate(blocks, file_path)
+    for suggestions, file_warnings in results:
         all_suggestions.extend(suggestions)
+        warnings.extend(file_warnings)
+
+    # One O(N log N) sort across all files instead of a partial sort per file
+    all_suggestions.sort(key=_suggestion_sort_key)
 
     return all_suggestions, warnings
 
@@ -784,26 +1141,36 @@ def print_coverage_gaps(suggestions: list[GapSuggestion]) -> None:
         print("No coverage gaps found - great job!")
         return
 
-    print(f"\n{'='*70}")
-    print(f"COVERAGE GAPS: {len(suggestions)} tests needed")
-    print(f"{'='*70}\n")
+    if not sys.stdout.isatty():
+        # Piped to a file or another tool: skip banners and templates and
+        # emit one tab-separated line per suggestion for grep/awk
+        sys.stdout.write(
+            "".join(
+                f"{s.priority}\t{s.test_file}\t{s.test_name}\t{s.description}\n"
+                for s in suggestions
+            )
+        )
+        return
+
+    # Accumulate lines and write once - thousands of print() calls each
+    # pay for the stdout lock and a write boundary, which adds up on CI
+    out: list[str] = []
+    out.append(f"\n{'='*70}")
+    out.append(f"COVERAGE GAPS: {len(suggestions)} tests needed")
+    out.append(f"{'='*70}\n")
 
     for i, suggestion in enumerate(suggestions, 1):
-        priority_marker = {
-            "critical": "[!!]",
-            "high": "[! ]",
-            "medium": "[  ]",
-            "low": "[  ]",
-        }.get(suggestion.priority, "[  ]")
+        priority_marker = _PRIORITY_MARKERS.get(suggestion.priority, "[  ]")
 
-        print(f"{i}. {priority_marker} [{suggestion.priority.upper():8}] {suggestion.test_name}")
-        print(f"   File: {suggestion.test_file}")
-        print(f"   Covers: {suggestion.description}")
+        out.append(f"{i}. {priority_marker} [{suggestion.priority.upper():8}] {suggestion.test_name}")
+        out.append(f"   File: {suggestion.test_file}")
+        out.append(f"   Covers: {suggestion.description}")
 
         if suggestion.setup_hints:
-            print(f"   Hints: {', '.join(suggestion.setup_hints)}")
+            out.append(f"   Hints: {', '.join(suggestion.setup_hints)}")
+
+        out.append("\n   Template:")
+        out.extend(f"   {line}" for line in suggestion.code_template.splitlines())
+        out.append("")
 
-        print(f"\n   Template:")
-        for line in suggestion.code_template.splitlines():
-            print(f"   {line}")
-        print()
+    sys.stdout.write("\n".join(out) + "\n")
@@ -22,6 +22,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Priority markers, hoisted so loops don't rebuild dict literals
+_SUMMARY_MARKERS = {"critical": "!!", "high": "!", "medium": "-", "low": " "}
+_SUGGESTION_MARKERS = {"critical": "!!", "high": "! ", "medium": "  ", "low": "  "}
+
 
 def cmd_gaps(args):
     """Find coverage gaps and suggest what tests to write."""
@@ -41,7 +45,7 @@ def cmd_gaps(args):
     # Parse coverage report for summary
     try:
         parser = CoverageParser()
-        report = parser.parse(str(coverage_path))
+        report = parser.parse(coverage_path)
     except Exception as e:
         if args.format == "json":
             print(json.dumps({"error": str(e)}, indent=2))
@@ -53,26 +57,28 @@ def cmd_gaps(args):
 
     # Find suggestions
     suggestions, warnings = find_coverage_gaps(
-        str(coverage_path),
+        coverage_path,
         source_root=args.source_root,
     )
 
-    # Text mode: print headers and warnings
+    # Text mode: buffer lines and write once - per-line print() calls add
+    # up on reports with thousands of suggestions
+    out: list[str] = []
     if args.format != "json":
-        print(f"\n{'='*60}")
-        print("code-covered")
-        print(f"{'='*60}")
-        print(f"Coverage: {report.coverage_percent:.1f}% ({report.total_covered}/{report.total_covered + report.total_missing} lines)")
-        print(f"Files analyzed: {len(report.files)} ({files_with_gaps} with gaps)")
+        out.append(f"\n{'='*60}")
+        out.append("code-covered")
+        out.append(f"{'='*60}")
+        out.append(f"Coverage: {report.coverage_percent:.1f}% ({report.total_covered}/{report.total_covered + report.total_missing} lines)")
+        out.append(f"Files analyzed: {len(report.files)} ({files_with_gaps} with gaps)")
 
         # Show warnings about files we couldn't process
         if warnings:
-            print(f"\nWarnings: {len(warnings)} files could not be analyzed")
+            out.append(f"\nWarnings: {len(warnings)} files could not be analyzed")
             if args.verbose:
                 for w in warnings[:5]:
-                    print(f"  - {w}")
+                    out.append(f"  - {w}")
                 if len(warnings) > 5:
-                    print(f"  ... and {len(warnings) - 5} more")
+                    out.append(f"  ... and {len(warnings) - 5} more")
 
     # Apply filters
     if args.priority:
@@ -91,7 +97,8 @@ def cmd_gaps(args):
                 "warnings": sorted(warnings),
             }, indent=2, sort_keys=True))
         else:
-            print("\nNo coverage gaps found - great job!")
+            out.append("\nNo coverage gaps found - great job!")
+            sys.stdout.write("\n".join(out) + "\n")
         return 0
 
     # JSON output mode
@@ -111,40 +118,48 @@ def cmd_gaps(args):
     for s in suggestions:
         by_priority.setdefault(s.priority, []).append(s)
 
-    print(f"\nMissing tests: {len(suggestions)}")
+    out.append(f"\nMissing tests: {len(suggestions)}")
     for priority in ["critical", "high", "medium", "low"]:
         count = len(by_priority.get(priority, []))
         if count:
-            marker = {"critical": "!!", "high": "!", "medium": "-", "low": " "}[priority]
-            print(f"  [{marker}] {priority.upper()}: {count}")
+            out.append(f"  [{_SUMMARY_MARKERS[priority]}] {priority.upper()}: {count}")
 
     # Output
     if args.verbose:
+        # Flush the buffer before print_coverage_gaps writes its own
+        sys.stdout.write("\n".join(out) + "\n")
+        out = []
         print_coverage_gaps(suggestions)
     else:
-        print("\nTop suggestions:")
+        out.append("\nTop suggestions:")
         for i, s in enumerate(suggestions[:10], 1):
-            marker = {"critical": "!!", "high": "! ", "medium": "  ", "low": "  "}.get(s.priority, "  ")
-            print(f"  {i}. [{marker}] {s.test_name}")
-            print(f"       {s.description}")
+            marker = _SUGGESTION_MARKERS.get(s.priority, "  ")
+            out.append(f"  {i}. [{marker}] {s.test_name}")
+            out.append(f"       {s.description}")
 
         if len(suggestions) > 10:
-            print(f"\n  ... and {len(suggestions) - 10} more (use -v to see all)")
+            out.append(f"\n  ... and {len(suggestions) - 10} more (use -v to see all)")
 
-    # Write to file if requested
+    # Write to file if requested - build the stub text in memory and
+    # write it in one go instead of several f.write calls per suggestion
     if args.output:
         output_path = Path(args.output)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write('"""Auto-generated test stubs from coverage gaps."""\n\n')
-            f.write("import pytest\n\n")
-            for s in suggestions:
-                f.write(f"# {s.description}\n")
-                f.write(f"# Priority: {s.priority}\n")
-                if s.setup_hints:
-                    f.write(f"# Hints: {', '.join(s.setup_hints)}\n")
-                f.write(s.code_template)
-                f.write("\n\n")
-        print(f"\nWrote {len(suggestions)} test stubs to {output_path}")
+        parts = [
+            '"""Auto-generated test stubs from coverage gaps."""\n\n',
+            "import pytest\n\n",
+        ]
+        for s in suggestions:
+            parts.append(f"# {s.description}\n")
+            parts.append(f"# Priority: {s.priority}\n")
+            if s.setup_hints:
+                parts.append(f"# Hints: {', '.join(s.setup_hints)}\n")
+            parts.append(s.code_template)
+            parts.append("\n\n")
+        output_path.write_text("".join(parts), encoding="utf-8")
+        out.append(f"\nWrote {len(suggestions)} test stubs to {output_path}")
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
     return 0
 
@@ -153,7 +168,11 @@ def main():
     parser = argparse.ArgumentParser(
         prog="code-covered",
         description="Find coverage gaps and suggest what tests to write",
-        epilog="Example: code-covered coverage.json -v"
+        epilog="Example: code-covered coverage.json -v",
+        # Without abbrev matching argparse stops scanning every registered
+        # optional per token, which keeps parsing linear when many flags
+        # are forwarded (e.g. from an @argfile)
+        allow_abbrev=False,
     )
 
     parser.add_argument(
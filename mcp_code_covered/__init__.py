@@ -4,7 +4,7 @@ MCP adapter for code-covered.
 Exposes the code_covered.gaps tool for MCP hosts.
 """
 
-from mcp_code_covered.tool import handle
+from mcp_code_covered.tool import handle, handle_bytes
 
-__all__ = ["handle"]
+__all__ = ["handle", "handle_bytes"]
 __version__ = "0.1.0"
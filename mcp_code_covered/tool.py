@@ -7,24 +7,123 @@ Accepts coverage.json as inline JSON or artifact reference.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import tempfile
-from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-# Import from the engine (sibling package)
+# Import from the engine (sibling package). The underscore helpers are
+# internal to the project, shared between the CLI and MCP entry points.
 from analyzer.coverage_gaps import (
-    CoverageParser,
+    _PARALLEL_MIN_FILES,
+    _STREAM_SIZE_THRESHOLD,
     GapSuggestion,
-    GapAnalyzer,
-    GapSuggestionGenerator,
+    _analyze_one_file,
+    _suggestion_sort_key,
 )
 
+# Optional streaming JSON parser for reports too large to decode in one shot
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional fast JSON parser, same pattern as the engine. orjson's
+# JSONDecodeError subclasses json.JSONDecodeError, so the error handling
+# in handle() works unchanged.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 # Priority scoring for threshold checks
 PRIORITY_SCORE = {"critical": 3, "high": 2, "medium": 1, "low": 0}
 PRIORITY_ORDER = ["critical", "high", "medium", "low"]
 
+# Text-output decorations, hoisted so loops don't rebuild dict literals
+_MARKERS = {"critical": "[!!]", "high": "[! ]", "medium": "[  ]", "low": "[  ]"}
+_PRIORITY_LABELS = {
+    "critical": "[!!] CRITICAL",
+    "high": "[!]  HIGH",
+    "medium": "[  ] MEDIUM",
+    "low": "[  ] LOW",
+}
+
+# Persistent per-file result cache: unchanged files (same path, same
+# source bytes, same missing lines) skip AST analysis entirely on repeat
+# requests. Bump the version whenever suggestion output changes shape or
+# content, or when the key format changes.
+_CACHE_VERSION = 2
+
+
+def _cache_path() -> Path:
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "code-covered" / "gaps.json"
+
+
+def _load_gap_cache() -> dict[str, list[dict]]:
+    """Load the on-disk gap cache; any problem means an empty cache."""
+    try:
+        with open(_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_gap_cache(entries: dict[str, list[dict]]) -> None:
+    """Write the gap cache atomically; failures are non-fatal."""
+    path = _cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": _CACHE_VERSION, "entries": entries}, f)
+        os.replace(tmp_name, path)
+    except OSError:
+        pass
+
+
+def _gap_cache_key(file_path: str, source_bytes: bytes, missing_lines: set[int]) -> str:
+    # The cached suggestions embed path-derived fields (test_file, test
+    # names, descriptions), so the path must be part of the key: an
+    # identical source at a different path is a different entry.
+    digest = hashlib.sha256(file_path.encode("utf-8", errors="replace"))
+    digest.update(source_bytes)
+    digest.update(repr(sorted(missing_lines)).encode())
+    return digest.hexdigest()
+
+
+# In-process memo of parsed coverage payloads. MCP hosts call the tool
+# repeatedly against the same report within one CI job; hashing the raw
+# bytes (or statting the locator) is far cheaper than re-decoding
+# multi-MB JSON every time. The persistent gap cache above covers the
+# AST-analysis half, so repeat calls skip both the parse and the
+# analysis. Nothing downstream mutates the parsed dict, so sharing the
+# cached object is safe.
+_REPORT_CACHE: dict[Any, dict[str, Any]] = {}
+_REPORT_CACHE_MAX = 8
+
+
+def _report_cache_put(key: Any, data: dict[str, Any]) -> dict[str, Any]:
+    if len(_REPORT_CACHE) >= _REPORT_CACHE_MAX:
+        # Drop the oldest entry (insertion order) to bound memory
+        _REPORT_CACHE.pop(next(iter(_REPORT_CACHE)))
+    _REPORT_CACHE[key] = data
+    return data
+
 
 def handle(
     request: dict[str, Any],
@@ -59,21 +158,23 @@ def handle(
 
     # 2. Parse and analyze
     try:
-        suggestions, warnings = _analyze_coverage_data(
+        suggestions, warnings, stats = _analyze_coverage_data(
             coverage_data,
             repo_root=request.get("repo_root"),
         )
     except Exception as e:
         return _error_response(f"Analysis failed: {e}")
 
-    # 3. Filter by priority if requested
+    # 3. Filter by priority if requested. Scores are computed once and
+    # carried alongside so filtering and gating compare plain ints
+    # instead of re-hashing priority strings per suggestion.
+    scores = [PRIORITY_SCORE.get(s.priority, 0) for s in suggestions]
     priority_filter = request.get("priority_filter")
     if priority_filter:
         min_score = PRIORITY_SCORE.get(priority_filter, 0)
-        suggestions = [
-            s for s in suggestions
-            if PRIORITY_SCORE.get(s.priority, 0) >= min_score
-        ]
+        kept = [(s, sc) for s, sc in zip(suggestions, scores, strict=True) if sc >= min_score]
+        suggestions = [s for s, _ in kept]
+        scores = [sc for _, sc in kept]
 
     # 4. Count by priority (after filter, before limit)
     total_suggestions = len(suggestions)
@@ -85,7 +186,7 @@ def handle(
     # 5. Compute exit code BEFORE limit (evaluate against filtered set)
     # This ensures CI gating sees all matching gaps, not just top N
     fail_on = request.get("fail_on", "none")
-    exit_code = _compute_exit_code(suggestions, fail_on)
+    exit_code = _compute_exit_code(suggestions, fail_on, scores)
 
     # 6. Apply limit if requested (for output only, doesn't affect gating)
     limit = request.get("limit")
@@ -94,7 +195,7 @@ def handle(
 
     # 7. Build result
     result = _build_result(
-        coverage_data,
+        stats,
         suggestions,
         total_suggestions,
         by_priority,
@@ -114,6 +215,24 @@ def handle(
     return response
 
 
+def handle_bytes(
+    request: dict[str, Any],
+    *,
+    artifact_resolver: Optional[Callable[[str], bytes]] = None,
+) -> bytes:
+    """
+    Like handle(), but returns the response pre-serialized as JSON bytes.
+
+    Hosts that would immediately re-serialize the response dict for the
+    wire can call this instead and skip that traversal; encoding goes
+    through orjson when the optional package is installed.
+    """
+    response = handle(request, artifact_resolver=artifact_resolver)
+    if orjson is not None:
+        return orjson.dumps(response)
+    return json.dumps(response).encode("utf-8")
+
+
 def _load_coverage(
     coverage: Any,
     *,
@@ -142,7 +261,11 @@ def _load_coverage(
         # Try artifact resolver first
         if artifact_resolver is not None:
             raw = artifact_resolver(coverage["artifact_id"])
-            return json.loads(raw.decode("utf-8"))
+            key = hashlib.sha256(raw).hexdigest()
+            cached = _REPORT_CACHE.get(key)
+            if cached is not None:
+                return cached
+            return _report_cache_put(key, _loads(raw))
 
         # Fall back to locator as file path
         locator = coverage.get("locator")
@@ -151,8 +274,35 @@ def _load_coverage(
                 "artifact reference requires either artifact_resolver or locator"
             )
 
-        with open(locator, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # One stat serves the memo key and the streaming-size check;
+        # an unchanged mtime+size means the previous parse is still good
+        st = os.stat(locator)
+        key = (locator, st.st_mtime_ns, st.st_size)
+        cached = _REPORT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        # Very large reports stream through ijson (when installed) so the
+        # typically ~80% of entries with no gaps never sit in memory as
+        # full line lists - they collapse to just the executed-line count
+        # that _build_result needs
+        if ijson is not None and st.st_size > _STREAM_SIZE_THRESHOLD:
+            files: dict[str, Any] = {}
+            with open(locator, "rb") as f:
+                for file_path, file_data in ijson.kvitems(f, "files"):
+                    if file_data.get("missing_lines"):
+                        files[file_path] = file_data
+                    else:
+                        files[file_path] = {
+                            "executed_lines_count": len(
+                                file_data.get("executed_lines") or ()
+                            ),
+                            "missing_lines": [],
+                        }
+            return _report_cache_put(key, {"files": files})
+
+        with open(locator, "rb") as f:
+            return _report_cache_put(key, _loads(f.read()))
 
     # Otherwise treat as inline coverage data
     # Validate it looks like coverage.json
@@ -167,103 +317,167 @@ def _load_coverage(
 def _analyze_coverage_data(
     coverage_data: dict[str, Any],
     repo_root: Optional[str] = None,
-) -> tuple[list[GapSuggestion], list[str]]:
+) -> tuple[list[GapSuggestion], list[str], dict[str, int]]:
     """
-    Analyze coverage data and return suggestions.
+    Analyze coverage data and return suggestions plus coverage stats.
 
-    This reimplements find_coverage_gaps() logic but works with
-    parsed JSON instead of a file path.
+    Works like find_coverage_gaps() but takes parsed JSON instead of a
+    file path. Per-file work runs in the engine's _analyze_one_file,
+    fanned out to worker processes for large reports. Coverage totals
+    are accumulated in the same pass that selects files for analysis,
+    so the files dict is walked exactly once.
 
     Args:
         coverage_data: Parsed coverage.json dict.
         repo_root: Optional root for resolving source file paths.
 
     Returns:
-        Tuple of (suggestions, warnings).
+        Tuple of (suggestions, warnings, stats) where stats holds
+        files_analyzed, files_with_gaps, total_covered, total_missing.
     """
-    all_suggestions: list[GapSuggestion] = []
-    warnings: list[str] = []
-
     files_data = coverage_data.get("files", {})
 
+    total_covered = 0
+    total_missing = 0
+    files_with_gaps = 0
+    targets: list[tuple[str, set[int]]] = []
+
     for file_path, file_data in files_data.items():
-        # Get coverage info
-        missing_lines = set(file_data.get("missing_lines", []))
-        if not missing_lines:
-            continue
+        # Streamed loads collapse gap-free entries to a count field
+        executed = file_data.get("executed_lines_count")
+        if executed is None:
+            executed = len(file_data.get("executed_lines", []))
+        missing_list = file_data.get("missing_lines", [])
 
-        # Resolve actual path
-        actual_path = file_path
-        if repo_root:
-            actual_path = str(Path(repo_root) / file_path)
+        total_covered += executed
+        total_missing += len(missing_list)
+        if missing_list:
+            files_with_gaps += 1
+            targets.append((file_path, set(missing_list)))
+
+    stats = {
+        "files_analyzed": len(files_data),
+        "files_with_gaps": files_with_gaps,
+        "total_covered": total_covered,
+        "total_missing": total_missing,
+    }
 
-        # Try to read source file
+    # Serve unchanged files from the persistent cache; only misses pay
+    # for AST analysis. The probe keeps each file's decoded text so a
+    # miss hands it straight to the worker instead of reading the file a
+    # second time.
+    cache = _load_gap_cache()
+    results: list[Optional[tuple[list[GapSuggestion], list[str]]]] = [None] * len(targets)
+    keys: list[Optional[str]] = [None] * len(targets)
+    sources: list[Optional[str]] = [None] * len(targets)
+    misses: list[int] = []
+
+    for i, (file_path, missing) in enumerate(targets):
+        actual_path = str(Path(repo_root) / file_path) if repo_root else file_path
         try:
-            with open(actual_path, "r", encoding="utf-8", errors="replace") as f:
-                source_code = f.read()
-        except FileNotFoundError:
-            warnings.append(f"Source file not found: {actual_path}")
+            with open(actual_path, "rb") as f:
+                source_bytes = f.read()
+        except OSError:
+            # Unreadable here - let the worker produce the precise warning
+            misses.append(i)
             continue
-        except PermissionError:
-            warnings.append(f"Permission denied reading: {actual_path}")
-            continue
-        except Exception as e:
-            warnings.append(f"Error reading {actual_path}: {e}")
+
+        key = _gap_cache_key(file_path, source_bytes, missing)
+        keys[i] = key
+        # Mirror _read_source's text mode: utf-8 with replacement,
+        # universal newlines
+        sources[i] = (
+            source_bytes.decode("utf-8", errors="replace")
+            .replace("\r\n", "\n")
+            .replace("\r", "\n")
+        )
+        entry = cache.get(key)
+        if entry is None:
+            misses.append(i)
             continue
+        try:
+            results[i] = ([GapSuggestion(**d) for d in entry], [])
+        except TypeError:
+            # Entry doesn't match the current dataclass shape (corrupt or
+            # hand-edited cache file): treat it as a miss so the fresh
+            # result overwrites it, instead of failing the whole request
+            misses.append(i)
+
+    miss_targets = [targets[i] for i in misses]
+    miss_sources = [sources[i] for i in misses]
+    if len(miss_targets) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            miss_results = list(executor.map(
+                _analyze_one_file,
+                (path for path, _ in miss_targets),
+                (missing for _, missing in miss_targets),
+                repeat(repo_root),
+                miss_sources,
+            ))
+    else:
+        miss_results = [
+            _analyze_one_file(path, missing, repo_root, source)
+            for (path, missing), source in zip(miss_targets, miss_sources, strict=True)
+        ]
 
-        # Analyze and generate suggestions
-        analyzer = GapAnalyzer(source_code, missing_lines)
-        blocks = analyzer.analyze(file_path)
+    dirty = False
+    for i, result in zip(misses, miss_results, strict=True):
+        results[i] = result
+        suggestions, file_warnings = result
+        key = keys[i]
+        if key and not file_warnings:
+            cache[key] = [s.to_dict() for s in suggestions]
+            dirty = True
+    if dirty:
+        _save_gap_cache(cache)
 
-        generator = GapSuggestionGenerator()
-        suggestions = generator.generate(blocks, file_path)
+    all_suggestions: list[GapSuggestion] = []
+    warnings: list[str] = []
+    for result in results:
+        suggestions, file_warnings = result if result else ([], [])
         all_suggestions.extend(suggestions)
+        warnings.extend(file_warnings)
+
+    all_suggestions.sort(key=_suggestion_sort_key)
 
-    return all_suggestions, warnings
+    return all_suggestions, warnings, stats
 
 
 def _build_result(
-    coverage_data: dict[str, Any],
+    stats: dict[str, int],
     suggestions: list[GapSuggestion],
     total_suggestions: int,
     by_priority: dict[str, int],
 ) -> dict[str, Any]:
     """Build the result object for the response."""
-    files_data = coverage_data.get("files", {})
-
-    # Calculate coverage stats
-    total_covered = 0
-    total_missing = 0
-    files_with_gaps = 0
-
-    for file_data in files_data.values():
-        executed = len(file_data.get("executed_lines", []))
-        missing = len(file_data.get("missing_lines", []))
-        total_covered += executed
-        total_missing += missing
-        if missing > 0:
-            files_with_gaps += 1
-
-    total_lines = total_covered + total_missing
-    coverage_percent = (total_covered / total_lines * 100) if total_lines > 0 else 100.0
+    total_lines = stats["total_covered"] + stats["total_missing"]
+    coverage_percent = (
+        (stats["total_covered"] / total_lines * 100) if total_lines > 0 else 100.0
+    )
 
     return {
         "coverage_percent": round(coverage_percent, 2),
-        "files_analyzed": len(files_data),
-        "files_with_gaps": files_with_gaps,
+        "files_analyzed": stats["files_analyzed"],
+        "files_with_gaps": stats["files_with_gaps"],
         "total_suggestions": total_suggestions,
         "suggestions": [s.to_dict() for s in suggestions],
         "by_priority": by_priority,
     }
 
 
-def _compute_exit_code(suggestions: list[GapSuggestion], fail_on: str) -> int:
+def _compute_exit_code(
+    suggestions: list[GapSuggestion],
+    fail_on: str,
+    scores: Optional[list[int]] = None,
+) -> int:
     """
     Compute exit code based on suggestions and threshold.
 
     Args:
         suggestions: List of gap suggestions.
         fail_on: Threshold setting ("none", "critical", "high", "any").
+        scores: Optional precomputed PRIORITY_SCORE values matching
+            suggestions; computed here when omitted.
 
     Returns:
         0 = success, 2 = threshold met.
@@ -274,11 +488,13 @@ def _compute_exit_code(suggestions: list[GapSuggestion], fail_on: str) -> int:
     if fail_on == "any" and suggestions:
         return 2
 
+    if scores is None:
+        scores = [PRIORITY_SCORE.get(s.priority, 0) for s in suggestions]
+
     threshold = PRIORITY_SCORE.get(fail_on, 0)
-    for s in suggestions:
-        score = PRIORITY_SCORE.get(s.priority, 0)
-        if score >= threshold:
-            return 2
+    # any() short-circuits on the first suggestion at or above threshold
+    if any(score >= threshold for score in scores):
+        return 2
 
     return 0
 
@@ -301,25 +517,16 @@ def _format_text_output(
 
     by_priority = result.get("by_priority", {})
     lines.append(f"Missing tests: {result['total_suggestions']}")
-    if by_priority.get("critical", 0) > 0:
-        lines.append(f"  [!!] CRITICAL: {by_priority['critical']}")
-    if by_priority.get("high", 0) > 0:
-        lines.append(f"  [!]  HIGH: {by_priority['high']}")
-    if by_priority.get("medium", 0) > 0:
-        lines.append(f"  [  ] MEDIUM: {by_priority['medium']}")
-    if by_priority.get("low", 0) > 0:
-        lines.append(f"  [  ] LOW: {by_priority['low']}")
+    for priority in PRIORITY_ORDER:
+        count = by_priority.get(priority, 0)
+        if count > 0:
+            lines.append(f"  {_PRIORITY_LABELS[priority]}: {count}")
     lines.append("")
 
     if suggestions:
         lines.append("Top suggestions:")
         for i, s in enumerate(suggestions[:10], 1):
-            marker = {
-                "critical": "[!!]",
-                "high": "[! ]",
-                "medium": "[  ]",
-                "low": "[  ]",
-            }.get(s.priority, "[  ]")
+            marker = _MARKERS.get(s.priority, "[  ]")
             lines.append(f"  {i}. {marker} {s.test_name}")
             lines.append(f"       {s.description}")
 
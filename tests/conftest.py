@@ -0,0 +1,41 @@
+"""Shared fixtures for the code-covered test suite."""
+
+import pytest
+
+from analyzer.coverage_gaps import CoverageParser, GapSuggestionGenerator
+
+
+# The MCP adapter persists its gap cache under XDG_CACHE_HOME (falling
+# back to ~/.cache). Point it at a throwaway directory for the whole
+# session so test runs neither read the developer's real cache nor
+# litter it with tmp-path entries.
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_gap_cache(tmp_path_factory):
+    mp = pytest.MonkeyPatch()
+    mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg-cache")))
+    yield
+    mp.undo()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help=(
+            "Serve golden analysis results from pytest's cache when the "
+            "fixture inputs are unchanged (speeds up --lf/watch loops)"
+        ),
+    )
+
+
+# Both classes are stateless between calls (their caches are keyed purely
+# on inputs), so one instance safely serves the whole session.
+@pytest.fixture(scope="session")
+def parser():
+    return CoverageParser()
+
+
+@pytest.fixture(scope="session")
+def generator():
+    return GapSuggestionGenerator()
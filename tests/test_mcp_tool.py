@@ -1,12 +1,16 @@
 """Tests for the MCP adapter (mcp_code_covered.tool)."""
 
+import copy
+import dataclasses
 import json
+from collections import Counter
 import shutil
 import pytest
 from pathlib import Path
 
 from mcp_code_covered.tool import (
     handle,
+    handle_bytes,
     _load_coverage,
     _compute_exit_code,
     _error_response,
@@ -15,6 +19,34 @@ from mcp_code_covered.tool import (
 from analyzer.coverage_gaps import GapSuggestion
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "mcp"
+_GOLDEN_SOURCE_PATH = FIXTURES_DIR / "golden_source.py"
+_GOLDEN_REQUEST_PATH = FIXTURES_DIR / "golden_request.json"
+
+# Source payloads written to disk by fixtures, kept as bytes constants so
+# each is encoded once and written with a single write_bytes call.
+SRC_SAMPLE = b'''
+def process(data):
+    if data is None:
+        raise ValueError("data cannot be None")
+    return data.strip()
+'''
+
+SRC_IF_RETURN = b'''
+def foo():
+    if True:
+        return 1
+    return 2
+'''
+
+SRC_MULTI_GAP = b'''
+def process(data):
+    if data is None:
+        raise ValueError("no data")
+    if not data:
+        return []
+    for item in data:
+        yield item
+'''
 
 
 class TestLoadCoverage:
@@ -108,80 +140,88 @@ class TestLoadCoverage:
 class TestComputeExitCode:
     """Tests for _compute_exit_code."""
 
+    _BASE_SUGGESTION = GapSuggestion(
+        test_name="test_base",
+        test_file="tests/test.py",
+        description="Test description",
+        covers_lines=[1],
+        priority="low",
+        code_template="def test(): pass",
+        setup_hints=[],
+        block_type="code_block",
+    )
+
     def _make_suggestion(self, priority: str) -> GapSuggestion:
-        return GapSuggestion(
-            test_name=f"test_{priority}",
-            test_file="tests/test.py",
-            description="Test description",
-            covers_lines=[1],
-            priority=priority,
-            code_template="def test(): pass",
-            setup_hints=[],
-            block_type="code_block",
+        return dataclasses.replace(
+            self._BASE_SUGGESTION, test_name=f"test_{priority}", priority=priority
         )
 
-    def test_exit_code_none_always_zero(self):
-        """Test fail_on='none' always returns 0."""
-        suggestions = [self._make_suggestion("critical")]
-        assert _compute_exit_code(suggestions, "none") == 0
-
-    def test_exit_code_any_with_suggestions(self):
-        """Test fail_on='any' returns 2 when there are suggestions."""
-        suggestions = [self._make_suggestion("low")]
-        assert _compute_exit_code(suggestions, "any") == 2
+    # Full truth table: every priority against every supported fail_on value.
+    @pytest.mark.parametrize(
+        "priority,fail_on,expected",
+        [
+            ("critical", "none", 0),
+            ("critical", "critical", 2),
+            ("critical", "high", 2),
+            ("critical", "any", 2),
+            ("high", "none", 0),
+            ("high", "critical", 0),
+            ("high", "high", 2),
+            ("high", "any", 2),
+            ("medium", "none", 0),
+            ("medium", "critical", 0),
+            ("medium", "high", 0),
+            ("medium", "any", 2),
+            ("low", "none", 0),
+            ("low", "critical", 0),
+            ("low", "high", 0),
+            ("low", "any", 2),
+        ],
+    )
+    def test_exit_code_threshold(self, priority, fail_on, expected):
+        """Test fail_on thresholds against a single suggestion's priority."""
+        suggestions = [self._make_suggestion(priority)]
+        assert _compute_exit_code(suggestions, fail_on) == expected
 
     def test_exit_code_any_without_suggestions(self):
         """Test fail_on='any' returns 0 when no suggestions."""
         assert _compute_exit_code([], "any") == 0
 
-    def test_exit_code_critical_threshold(self):
-        """Test fail_on='critical' only fails on critical."""
-        critical = [self._make_suggestion("critical")]
-        high = [self._make_suggestion("high")]
 
-        assert _compute_exit_code(critical, "critical") == 2
-        assert _compute_exit_code(high, "critical") == 0
+# The sample source/coverage pair is read-only for every test, so one copy
+# on disk serves the whole module instead of being rewritten per test.
+@pytest.fixture(scope="module")
+def sample_source(tmp_path_factory):
+    """Create a sample source file for testing."""
+    source = tmp_path_factory.mktemp("sample") / "src" / "module.py"
+    source.parent.mkdir(parents=True, exist_ok=True)
+    source.write_bytes(SRC_SAMPLE)
+    return source
+
+
+@pytest.fixture(scope="module")
+def sample_coverage(sample_source):
+    """Create sample coverage data."""
+    return {
+        "files": {
+            str(sample_source): {
+                "executed_lines": [2, 5],
+                "missing_lines": [3, 4],
+                "excluded_lines": [],
+            }
+        }
+    }
 
-    def test_exit_code_high_threshold(self):
-        """Test fail_on='high' fails on high or critical."""
-        critical = [self._make_suggestion("critical")]
-        high = [self._make_suggestion("high")]
-        medium = [self._make_suggestion("medium")]
 
-        assert _compute_exit_code(critical, "high") == 2
-        assert _compute_exit_code(high, "high") == 2
-        assert _compute_exit_code(medium, "high") == 0
+@pytest.fixture(scope="module")
+def sample_coverage_bytes(sample_coverage):
+    """Sample coverage serialized once for tests that write it to disk."""
+    return json.dumps(sample_coverage).encode("utf-8")
 
 
 class TestHandle:
     """Tests for the main handle function."""
 
-    @pytest.fixture
-    def sample_source(self, tmp_path):
-        """Create a sample source file for testing."""
-        source = tmp_path / "src" / "module.py"
-        source.parent.mkdir(parents=True, exist_ok=True)
-        source.write_text("""
-def process(data):
-    if data is None:
-        raise ValueError("data cannot be None")
-    return data.strip()
-""")
-        return source
-
-    @pytest.fixture
-    def sample_coverage(self, sample_source):
-        """Create sample coverage data."""
-        return {
-            "files": {
-                str(sample_source): {
-                    "executed_lines": [2, 5],
-                    "missing_lines": [3, 4],
-                    "excluded_lines": [],
-                }
-            }
-        }
-
     def test_handle_inline_coverage(self, sample_coverage, sample_source):
         """Test handling inline coverage data."""
         request = {"coverage": sample_coverage}
@@ -189,14 +229,15 @@ def process(data):
 
         assert response["exit_code"] == 0
         assert "result" in response
-        assert response["result"]["files_analyzed"] == 1
-        assert response["result"]["files_with_gaps"] == 1
-        assert len(response["result"]["suggestions"]) > 0
+        result = response["result"]
+        assert result["files_analyzed"] == 1
+        assert result["files_with_gaps"] == 1
+        assert len(result["suggestions"]) > 0
 
-    def test_handle_with_artifact_locator(self, sample_coverage, sample_source, tmp_path):
+    def test_handle_with_artifact_locator(self, sample_coverage_bytes, sample_source, tmp_path):
         """Test handling artifact reference with locator."""
         coverage_file = tmp_path / "coverage.json"
-        coverage_file.write_text(json.dumps(sample_coverage))
+        coverage_file.write_bytes(sample_coverage_bytes)
 
         request = {
             "coverage": {
@@ -210,6 +251,23 @@ def process(data):
         assert response["exit_code"] == 0
         assert response["result"]["files_analyzed"] == 1
 
+    def test_handle_with_artifact_resolver(self, sample_coverage_bytes, sample_source):
+        """Test handling artifact reference resolved via artifact_resolver."""
+        def resolver(artifact_id: str) -> bytes:
+            assert artifact_id == "test-artifact"
+            return sample_coverage_bytes
+
+        request = {
+            "coverage": {
+                "artifact_id": "test-artifact",
+                "media_type": "application/json",
+            }
+        }
+        response = handle(request, artifact_resolver=resolver)
+
+        assert response["exit_code"] == 0
+        assert response["result"]["files_analyzed"] == 1
+
     def test_handle_with_text_format(self, sample_coverage, sample_source):
         """Test requesting text format output."""
         request = {
@@ -259,11 +317,10 @@ def process(data):
         }
         response = handle(request)
 
-        assert len(response["result"]["suggestions"]) <= 1
+        result = response["result"]
+        assert len(result["suggestions"]) <= 1
         # total_suggestions should reflect count before limit
-        assert response["result"]["total_suggestions"] >= len(
-            response["result"]["suggestions"]
-        )
+        assert result["total_suggestions"] >= len(result["suggestions"])
 
     def test_handle_invalid_coverage(self):
         """Test handling invalid coverage data."""
@@ -301,6 +358,15 @@ def process(data):
         assert response["result"]["suggestions"] == []
         assert response["result"]["coverage_percent"] == 100.0
 
+    def test_handle_bytes_matches_handle(self, sample_coverage, sample_source):
+        """Test handle_bytes returns the handle() response as JSON bytes."""
+        request = {"coverage": sample_coverage}
+
+        raw = handle_bytes(request)
+
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == handle(request)
+
     def test_handle_determinism(self, sample_coverage, sample_source):
         """Test that same request produces identical results."""
         request = {"coverage": sample_coverage}
@@ -320,11 +386,11 @@ def process(data):
         by_priority = response["result"]["by_priority"]
         suggestions = response["result"]["suggestions"]
 
-        # Verify counts match actual suggestions
+        # Verify counts match actual suggestions (tallied in one pass)
+        observed = Counter(s["priority"] for s in suggestions)
         for priority in ["critical", "high", "medium", "low"]:
-            expected = sum(1 for s in suggestions if s["priority"] == priority)
             # Note: by_priority is counted before any limit
-            assert by_priority[priority] >= expected
+            assert by_priority[priority] >= observed[priority]
 
 
 class TestErrorResponse:
@@ -341,6 +407,30 @@ class TestErrorResponse:
         assert "Test error message" in response["warnings"]
 
 
+# Field names the response contract promises, checked as set inclusions.
+_REQUIRED_RESULT = frozenset(
+    {
+        "coverage_percent",
+        "files_analyzed",
+        "files_with_gaps",
+        "total_suggestions",
+        "suggestions",
+        "by_priority",
+    }
+)
+_REQUIRED_SUGGESTION = frozenset(
+    {
+        "test_name",
+        "test_file",
+        "description",
+        "covers_lines",
+        "priority",
+        "code_template",
+        "block_type",
+    }
+)
+
+
 class TestResponseSchema:
     """Tests to verify response matches schema expectations."""
 
@@ -365,23 +455,12 @@ class TestResponseSchema:
         assert "result" in response
 
         # Required result fields
-        result = response["result"]
-        assert "coverage_percent" in result
-        assert "files_analyzed" in result
-        assert "files_with_gaps" in result
-        assert "total_suggestions" in result
-        assert "suggestions" in result
-        assert "by_priority" in result
+        assert _REQUIRED_RESULT <= response["result"].keys()
 
     def test_suggestion_has_required_fields(self, tmp_path):
         """Test suggestions contain all required fields."""
         source = tmp_path / "test.py"
-        source.write_text("""
-def foo():
-    if True:
-        return 1
-    return 2
-""")
+        source.write_bytes(SRC_IF_RETURN)
         coverage = {
             "files": {
                 str(source): {
@@ -394,19 +473,29 @@ def foo():
         response = handle(request)
 
         for suggestion in response["result"]["suggestions"]:
-            assert "test_name" in suggestion
-            assert "test_file" in suggestion
-            assert "description" in suggestion
-            assert "covers_lines" in suggestion
-            assert "priority" in suggestion
-            assert "code_template" in suggestion
-            assert "block_type" in suggestion
+            assert _REQUIRED_SUGGESTION <= suggestion.keys()
+
+
+@pytest.fixture(scope="session")
+def golden_env(tmp_path_factory):
+    """Golden source copied to disk once, plus the parsed request template.
+
+    The source file is read-only for every consumer and the template is
+    deep-copied per test, so one session-wide copy/parse is safe.
+    """
+    src_dir = tmp_path_factory.mktemp("golden") / "src"
+    src_dir.mkdir()
+    source = src_dir / "validator.py"
+    shutil.copy(_GOLDEN_SOURCE_PATH, source)
+    # json.loads accepts bytes directly, so skip the text-mode decode layer
+    template = json.loads(_GOLDEN_REQUEST_PATH.read_bytes())
+    return source, template
 
 
 class TestGoldenFixture:
     """Golden fixture test to ensure MCP contract stability."""
 
-    def test_golden_host_call(self, tmp_path):
+    def test_golden_host_call(self, golden_env):
         """
         End-to-end test simulating a real MCP host call.
 
@@ -415,18 +504,12 @@ class TestGoldenFixture:
         2. Verifies response structure matches expected contract
         3. Ensures deterministic output across runs
         """
-        # Copy source fixture to temp location matching coverage paths
-        src_dir = tmp_path / "src"
-        src_dir.mkdir()
-        golden_source = FIXTURES_DIR / "golden_source.py"
-        shutil.copy(golden_source, src_dir / "validator.py")
-
-        # Load request fixture and update paths
-        request = json.loads((FIXTURES_DIR / "golden_request.json").read_text())
+        source, template = golden_env
+        request = copy.deepcopy(template)
 
         # Update coverage paths to point to temp location
         request["coverage"]["files"] = {
-            str(src_dir / "validator.py"): request["coverage"]["files"]["src/validator.py"]
+            str(source): request["coverage"]["files"]["src/validator.py"]
         }
 
         # Execute
@@ -439,12 +522,7 @@ class TestGoldenFixture:
         assert isinstance(response["warnings"], list)
 
         result = response["result"]
-        assert "coverage_percent" in result
-        assert "files_analyzed" in result
-        assert "files_with_gaps" in result
-        assert "total_suggestions" in result
-        assert "suggestions" in result
-        assert "by_priority" in result
+        assert _REQUIRED_RESULT <= result.keys()
 
         # Verify determinism: run twice, same result
         response2 = handle(request)
@@ -457,46 +535,48 @@ class TestGoldenFixture:
             assert response["exit_code"] == 2
 
 
-class TestFailOnLimitInteraction:
-    """Tests for fail_on and limit interaction (gating contract)."""
+@pytest.fixture(scope="module")
+def multi_gap_source(tmp_path_factory):
+    """Create source with multiple gap types."""
+    source = tmp_path_factory.mktemp("multi_gap") / "multi.py"
+    source.write_bytes(SRC_MULTI_GAP)
+    return source
 
-    @pytest.fixture
-    def multi_gap_source(self, tmp_path):
-        """Create source with multiple gap types."""
-        source = tmp_path / "multi.py"
-        source.write_text("""
-def process(data):
-    if data is None:
-        raise ValueError("no data")
-    if not data:
-        return []
-    for item in data:
-        yield item
-""")
-        return source
 
-    @pytest.fixture
-    def multi_gap_coverage(self, multi_gap_source):
-        """Coverage with multiple gap priorities."""
-        return {
-            "files": {
-                str(multi_gap_source): {
-                    "executed_lines": [2, 5, 7],
-                    "missing_lines": [3, 4, 6, 8],  # raise, if-true, return, for-loop
-                }
+@pytest.fixture(scope="module")
+def multi_gap_coverage(multi_gap_source):
+    """Coverage with multiple gap priorities."""
+    return {
+        "files": {
+            str(multi_gap_source): {
+                "executed_lines": [2, 5, 7],
+                "missing_lines": [3, 4, 6, 8],  # raise, if-true, return, for-loop
             }
         }
+    }
+
+
+@pytest.fixture(scope="module")
+def multi_gap_full_response(multi_gap_coverage):
+    """Unlimited fail_on='any' baseline, computed once for the class.
+
+    handle() is deterministic (test_handle_determinism covers that), so
+    tests comparing limited/filtered runs against the full result can
+    share one baseline call.
+    """
+    return handle({"coverage": multi_gap_coverage, "fail_on": "any"})
+
+
+class TestFailOnLimitInteraction:
+    """Tests for fail_on and limit interaction (gating contract)."""
 
-    def test_fail_on_evaluates_before_limit(self, multi_gap_coverage):
+    def test_fail_on_evaluates_before_limit(self, multi_gap_coverage, multi_gap_full_response):
         """
         Verify fail_on is evaluated BEFORE limit is applied.
 
         This ensures CI gating sees all filtered gaps, not just top N.
         """
-        # Get all suggestions first
-        full_request = {"coverage": multi_gap_coverage, "fail_on": "any"}
-        full_response = handle(full_request)
-        total_gaps = full_response["result"]["total_suggestions"]
+        total_gaps = multi_gap_full_response["result"]["total_suggestions"]
 
         # Now request with limit=1 but fail_on="any"
         limited_request = {
@@ -508,9 +588,10 @@ def process(data):
 
         # Should still fail even though only 1 suggestion returned
         assert limited_response["exit_code"] == 2
-        assert len(limited_response["result"]["suggestions"]) == 1
+        limited_result = limited_response["result"]
+        assert len(limited_result["suggestions"]) == 1
         # total_suggestions should reflect pre-limit count
-        assert limited_response["result"]["total_suggestions"] == total_gaps
+        assert limited_result["total_suggestions"] == total_gaps
 
     def test_fail_on_respects_priority_filter(self, multi_gap_coverage):
         """